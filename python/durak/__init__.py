@@ -51,6 +51,7 @@ from .tokenizer import (
     tokenize_text,
     tokenize_with_offsets,
     tokenize_with_normalized_offsets,
+    tokenize_with_normalized_offsets_batch,
 )
 
 __all__ = [
@@ -100,6 +101,7 @@ __all__ = [
     "tokenize_text",
     "tokenize_with_offsets",
     "tokenize_with_normalized_offsets",
+    "tokenize_with_normalized_offsets_batch",
     "Tokenizer",
     "TokenizationError",
 ]
@@ -93,6 +93,29 @@ def tokenize_with_normalized_offsets(text: str) -> list[tuple[str, int, int]]:
     """
     ...
 
+def tokenize_with_normalized_offsets_batch(
+    texts: list[str],
+) -> list[list[tuple[str, int, int]]]:
+    """Batch version of :func:`tokenize_with_normalized_offsets`.
+
+    Tokenizes every text in a single call, crossing the Python/Rust boundary once
+    per batch instead of once per text. Useful for corpus preprocessing and for
+    batched ``datasets.map(batched=True)`` style pipelines.
+
+    Args:
+        texts: The texts to tokenize
+
+    Returns:
+        One list of (normalized_token, start_index, end_index) tuples per input
+        text, in input order. Offsets are character positions in the
+        corresponding original text.
+
+    Examples:
+        >>> tokenize_with_normalized_offsets_batch(["İstanbul", "IĞDIR'a"])
+        [[('istanbul', 0, 8)], [("ığdır'a", 0, 7)]]
+    """
+    ...
+
 def lookup_lemma(word: str) -> str | None:
     """Perform exact dictionary lookup for lemmatization.
 
@@ -270,6 +293,7 @@ __all__ = [
     "fast_normalize",
     "tokenize_with_offsets",
     "tokenize_with_normalized_offsets",
+    "tokenize_with_normalized_offsets_batch",
     "lookup_lemma",
     "strip_suffixes",
     "strip_suffixes_validated",
@@ -21,6 +21,7 @@ UNICODE_REPLACEMENTS = {
     "\u2013": "-",
     "\u00a0": " ",
 }
+UNICODE_TRANSLATION_TABLE = str.maketrans(UNICODE_REPLACEMENTS)
 
 # Replace script/style blocks before stripping tags to avoid leaking JS/CSS.
 SCRIPT_STYLE_PATTERN = re.compile(
@@ -34,6 +35,10 @@ WHITESPACE_PATTERN = re.compile(r"\s+")
 
 TRAILING_PUNCTUATION = {".", ",", "!", "?", ";", ":"}
 
+# Turkish-specific case pairs applied in a single pass before str.lower/upper.
+TURKISH_LOWER_TABLE = str.maketrans({"I": "ı", "İ": "i", "Â": "â", "Î": "î", "Û": "û"})
+TURKISH_UPPER_TABLE = str.maketrans({"i": "İ", "ı": "I", "â": "Â", "î": "Î", "û": "Û"})
+
 # Emoji pattern: comprehensive Unicode emoji ranges
 # Covers emoji characters, emoji modifiers, and emoji sequences
 # Note: No '+' quantifier to match individual emojis, not consecutive groups
@@ -79,9 +84,9 @@ def normalize_unicode(text: str) -> str:
     """Apply NFC normalization and map variants to standard characters."""
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFC", text)
-    translation_table = str.maketrans(UNICODE_REPLACEMENTS)
-    return normalized.translate(translation_table)
+    # ASCII text is already NFC, so only run the normalizer when it can matter.
+    normalized = text if text.isascii() else unicodedata.normalize("NFC", text)
+    return normalized.translate(UNICODE_TRANSLATION_TABLE)
 
 
 def strip_html(text: str) -> str:
@@ -108,23 +113,9 @@ def normalize_case(text: str, mode: str = "lower") -> str:
         return text
 
     if mode == "lower":
-        adjusted = (
-            text.replace("I", "ı")
-            .replace("İ", "i")
-            .replace("Â", "â")
-            .replace("Î", "î")
-            .replace("Û", "û")
-        )
-        return adjusted.lower()
+        return text.translate(TURKISH_LOWER_TABLE).lower()
     if mode == "upper":
-        adjusted = (
-            text.replace("i", "İ")
-            .replace("ı", "I")
-            .replace("â", "Â")
-            .replace("î", "Î")
-            .replace("û", "Û")
-        )
-        return adjusted.upper()
+        return text.translate(TURKISH_UPPER_TABLE).upper()
 
     raise ConfigurationError(
         f"Unsupported mode '{mode}'. Expected 'lower', 'upper', or 'none'."
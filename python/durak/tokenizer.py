@@ -141,6 +141,9 @@ try:
     from . import _durak_core
     tokenize_with_offsets = _durak_core.tokenize_with_offsets
     tokenize_with_normalized_offsets = _durak_core.tokenize_with_normalized_offsets
+    tokenize_with_normalized_offsets_batch = (
+        _durak_core.tokenize_with_normalized_offsets_batch
+    )
 except ImportError:
     def tokenize_with_offsets(text: str) -> list[tuple[str, int, int]]:
         raise RustExtensionError(
@@ -152,6 +155,13 @@ except ImportError:
             "Rust extension not installed. Run: maturin develop"
         )
 
+    def tokenize_with_normalized_offsets_batch(
+        texts: list[str],
+    ) -> list[list[tuple[str, int, int]]]:
+        raise RustExtensionError(
+            "Rust extension not installed. Run: maturin develop"
+        )
+
 
 def normalize_tokens(
     tokens: Iterable[str],
@@ -63,6 +63,30 @@ fn get_token_regex() -> &'static Regex {
     })
 }
 
+/// Converts regex byte offsets into Python character offsets.
+/// Matches arrive in increasing order, so the tracker resumes counting from the
+/// previous match instead of rescanning the whole prefix for every token.
+struct CharOffsetTracker<'a> {
+    text: &'a str,
+    byte_pos: usize,
+    char_pos: usize,
+}
+
+impl<'a> CharOffsetTracker<'a> {
+    fn new(text: &'a str) -> Self {
+        Self { text, byte_pos: 0, char_pos: 0 }
+    }
+
+    /// Return the (start, end) character offsets for a byte range at or after the previous one
+    fn span(&mut self, byte_start: usize, byte_end: usize) -> (usize, usize) {
+        let char_start = self.char_pos + self.text[self.byte_pos..byte_start].chars().count();
+        let char_end = char_start + self.text[byte_start..byte_end].chars().count();
+        self.byte_pos = byte_end;
+        self.char_pos = char_end;
+        (char_start, char_end)
+    }
+}
+
 /// Fast normalization for Turkish text.
 /// Handles I/ı and İ/i conversion correctly and optionally lowercases the rest.
 /// 
@@ -127,33 +151,15 @@ fn fast_normalize(text: &str, lowercase: bool, handle_turkish_i: bool) -> String
 #[pyfunction]
 fn tokenize_with_offsets(text: &str) -> Vec<(String, usize, usize)> {
     let re = get_token_regex();
+    let mut offsets = CharOffsetTracker::new(text);
     let mut results = Vec::new();
 
-    for caps in re.captures_iter(text) {
-        if let Some(mat) = caps.get(0) {
-            let token = mat.as_str().to_string();
-            // In Rust regex, `mat.start()` and `mat.end()` return byte indices.
-            // Python expects character indices. We must convert carefully.
-            // However, typical NLP tools often work with byte offsets or char offsets.
-            // Here we want char offsets strictly for Python compatibility if possible,
-            // OR we just return byte offsets and let Python handle it?
-            // "The Fix: Your Rust tokenizer must return Offset Mappings (start/end indices pointing back to the original raw text)"
-            // Usually Python users expect char indices.
-            
-            // Converting byte offset to char offset is O(N) scan unless we map it.
-            // For now, let's just return what Regex gives us, which is byte offsets, 
-            // BUT for this PoC we can do a quick char count up to that point if we want absolute correctness,
-            // or just note that these are byte offsets (Rust UTF-8).
-            // Let's implement char offset conversion for correctness.
-            let byte_start = mat.start();
-            let byte_end = mat.end();
-            
-            let char_start = text[..byte_start].chars().count();
-            let char_len = text[byte_start..byte_end].chars().count();
-            let char_end = char_start + char_len;
-            
-            results.push((token, char_start, char_end));
-        }
+    // Only the overall match is needed, so `find_iter` avoids resolving capture groups.
+    // In Rust regex, `mat.start()` and `mat.end()` return byte indices, while Python
+    // expects character indices; the tracker converts them in a single forward pass.
+    for mat in re.find_iter(text) {
+        let (char_start, char_end) = offsets.span(mat.start(), mat.end());
+        results.push((mat.as_str().to_string(), char_start, char_end));
     }
     results
 }
@@ -171,26 +177,28 @@ fn tokenize_with_offsets(text: &str) -> Vec<(String, usize, usize)> {
 #[pyfunction]
 fn tokenize_with_normalized_offsets(text: &str) -> Vec<(String, usize, usize)> {
     let re = get_token_regex();
+    let mut offsets = CharOffsetTracker::new(text);
     let mut results = Vec::new();
 
-    for caps in re.captures_iter(text) {
-        if let Some(mat) = caps.get(0) {
-            let token = mat.as_str();
-            let normalized_token = fast_normalize(token, true, true);
-            
-            let byte_start = mat.start();
-            let byte_end = mat.end();
-            
-            let char_start = text[..byte_start].chars().count();
-            let char_len = text[byte_start..byte_end].chars().count();
-            let char_end = char_start + char_len;
-            
-            results.push((normalized_token, char_start, char_end));
-        }
+    for mat in re.find_iter(text) {
+        let normalized_token = fast_normalize(mat.as_str(), true, true);
+        let (char_start, char_end) = offsets.span(mat.start(), mat.end());
+        results.push((normalized_token, char_start, char_end));
     }
     results
 }
 
+/// Batch version of `tokenize_with_normalized_offsets`.
+/// Tokenizes many texts in a single call so the Python/Rust boundary is crossed once
+/// per batch instead of once per text. Offsets in each result refer to its own text.
+#[pyfunction]
+fn tokenize_with_normalized_offsets_batch(texts: Vec<String>) -> Vec<Vec<(String, usize, usize)>> {
+    texts
+        .iter()
+        .map(|text| tokenize_with_normalized_offsets(text))
+        .collect()
+}
+
 /// Tier 1: Exact Lookup
 #[pyfunction]
 fn lookup_lemma(word: &str) -> Option<String> {
@@ -440,6 +448,7 @@ fn _durak_core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(fast_normalize, m)?)?;
     m.add_function(wrap_pyfunction!(tokenize_with_offsets, m)?)?;
     m.add_function(wrap_pyfunction!(tokenize_with_normalized_offsets, m)?)?;
+    m.add_function(wrap_pyfunction!(tokenize_with_normalized_offsets_batch, m)?)?;
 
     // Lemmatization functions
     m.add_function(wrap_pyfunction!(lookup_lemma, m)?)?;
@@ -470,6 +479,25 @@ fn _durak_core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_tokenize_offsets_are_char_based() {
+        // Multi-byte Turkish characters must not shift later offsets
+        let text = "İğne ve Şişe, IĞDIR'da!";
+        let tokens = tokenize_with_offsets(text);
+        let chars: Vec<char> = text.chars().collect();
+
+        for (token, start, end) in &tokens {
+            let slice: String = chars[*start..*end].iter().collect();
+            assert_eq!(&slice, token, "offsets ({}, {}) should slice '{}'", start, end, token);
+        }
+        assert_eq!(tokens.last().map(|t| (t.1, t.2)), Some((22, 23)));
+
+        let normalized = tokenize_with_normalized_offsets(text);
+        let spans: Vec<(usize, usize)> = tokens.iter().map(|t| (t.1, t.2)).collect();
+        let normalized_spans: Vec<(usize, usize)> = normalized.iter().map(|t| (t.1, t.2)).collect();
+        assert_eq!(spans, normalized_spans);
+    }
+
     #[test]
     fn test_lemma_dict_loading() {
         let dict = get_lemma_dict();
@@ -6,8 +6,17 @@
 use std::collections::HashSet;
 use std::sync::OnceLock;
 
-/// Turkish vowels (both lowercase and uppercase)
-const TURKISH_VOWELS: &[char] = &['a', 'e', 'ı', 'i', 'o', 'ö', 'u', 'ü', 'A', 'E', 'I', 'İ', 'O', 'Ö', 'U', 'Ü'];
+/// Check whether a character is a Turkish vowel (both lowercase and uppercase)
+///
+/// A `match` lets the compiler emit a range/jump-table test instead of a
+/// linear scan over a slice of vowels for every character.
+#[inline]
+fn is_turkish_vowel(c: char) -> bool {
+    matches!(
+        c,
+        'a' | 'e' | 'ı' | 'i' | 'o' | 'ö' | 'u' | 'ü' | 'A' | 'E' | 'I' | 'İ' | 'O' | 'Ö' | 'U' | 'Ü'
+    )
+}
 
 /// Impossible Turkish consonant clusters at word end
 const INVALID_FINAL_CLUSTERS: &[&str] = &[
@@ -20,6 +29,7 @@ const INVALID_FINAL_CLUSTERS: &[&str] = &[
 /// Embedded valid roots from lemma dictionary
 static LEMMA_DICT_DATA: &str = include_str!("../resources/tr/lemmas/turkish_lemma_dict.txt");
 static VALID_ROOTS: OnceLock<HashSet<String>> = OnceLock::new();
+static INVALID_FINAL_CLUSTER_SET: OnceLock<HashSet<(char, char)>> = OnceLock::new();
 
 /// Get valid root words from lemma dictionary
 fn get_valid_roots() -> &'static HashSet<String> {
@@ -42,6 +52,34 @@ fn get_valid_roots() -> &'static HashSet<String> {
     })
 }
 
+/// Get invalid final clusters keyed by their two characters
+fn get_invalid_final_clusters() -> &'static HashSet<(char, char)> {
+    INVALID_FINAL_CLUSTER_SET.get_or_init(|| {
+        INVALID_FINAL_CLUSTERS
+            .iter()
+            .filter_map(|cluster| {
+                let mut chars = cluster.chars();
+                Some((chars.next()?, chars.next()?))
+            })
+            .collect()
+    })
+}
+
+/// Check whether a word ends with an impossible consonant cluster
+///
+/// Only the last two characters are lowercased and looked up, instead of
+/// lowercasing the whole word and testing every cluster with `ends_with`.
+fn ends_with_invalid_cluster(word: &str) -> bool {
+    let mut tail = word
+        .chars()
+        .rev()
+        .map(|c| c.to_lowercase().next().unwrap_or(c));
+    match (tail.next(), tail.next()) {
+        (Some(last), Some(prev)) => get_invalid_final_clusters().contains(&(prev, last)),
+        _ => false,
+    }
+}
+
 /// Root validity checker for Turkish morphology
 pub struct RootValidator {
     /// Minimum acceptable root length (characters)
@@ -102,19 +140,12 @@ impl RootValidator {
         }
         
         // Must contain at least one vowel
-        if !word.chars().any(|c| TURKISH_VOWELS.contains(&c)) {
+        if !word.chars().any(is_turkish_vowel) {
             return false;
         }
         
         // Check for invalid final consonant clusters
-        let word_lower = word.to_lowercase();
-        for cluster in INVALID_FINAL_CLUSTERS {
-            if word_lower.ends_with(cluster) {
-                return false;
-            }
-        }
-        
-        true
+        !ends_with_invalid_cluster(word)
     }
 }
 
@@ -137,10 +168,22 @@ mod tests {
         assert!(validator.is_valid_root("karma")); // Has vowels
     }
     
+    #[test]
+    fn test_vowel_detection() {
+        for c in "aeıioöuüAEIİOÖUÜ".chars() {
+            assert!(is_turkish_vowel(c), "'{}' should be a vowel", c);
+        }
+        for c in "bcçdfgğhjklmnprsştvyzBÇĞŞ'1 ".chars() {
+            assert!(!is_turkish_vowel(c), "'{}' should not be a vowel", c);
+        }
+    }
+
     #[test]
     fn test_invalid_clusters() {
         let validator = RootValidator::default();
         assert!(!validator.is_valid_root("kitaçk")); // Invalid final cluster
+        assert!(!validator.is_valid_root("KİTAÇK")); // Case-insensitive
+        assert!(validator.is_valid_root("kitaçı"));  // Cluster not at the end
         assert!(validator.is_valid_root("kitap"));   // Valid
     }
     
@@ -7,6 +7,11 @@ def test_normalize_unicode_handles_typographic_variants() -> None:
     assert cleaning.normalize_unicode(raw) == '"İstanbul\'da-efsane!"'
 
 
+def test_normalize_unicode_composes_decomposed_input() -> None:
+    assert cleaning.normalize_unicode("I\u0307stanbul") == "İstanbul"
+    assert cleaning.normalize_unicode("Merhaba") == "Merhaba"
+
+
 def test_strip_html_removes_tags_and_scripts() -> None:
     html_text = "<p>Merhaba <strong>dünya</strong></p><script>alert('x')</script>"
     assert cleaning.strip_html(html_text) == "Merhaba dünya"
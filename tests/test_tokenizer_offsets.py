@@ -1,7 +1,11 @@
 import pytest
 
 from durak.exceptions import RustExtensionError
-from durak.tokenizer import tokenize_with_offsets, tokenize_with_normalized_offsets
+from durak.tokenizer import (
+    tokenize_with_normalized_offsets,
+    tokenize_with_normalized_offsets_batch,
+    tokenize_with_offsets,
+)
 
 
 def test_offset_mapping():
@@ -182,6 +186,22 @@ def test_normalized_offsets_ner_use_case():
     assert text[entity_token[1]:entity_token[2]] == "İstanbul"  # Original text
 
 
+def test_normalized_offsets_batch_matches_single_calls():
+    """Batch tokenization returns the per-text results in input order."""
+    try:
+        import _durak_core  # noqa: F401
+    except ImportError:
+        pytest.skip("Rust extension not installed")
+
+    texts = ["İstanbul'a gittim.", "", "IĞDIR güzel", "İğne"]
+    results = tokenize_with_normalized_offsets_batch(texts)
+
+    assert len(results) == len(texts)
+    assert results[1] == []
+    for text, tokens in zip(texts, results):
+        assert tokens == tokenize_with_normalized_offsets(text)
+
+
 # ============================================================================
 # Tests for error handling when Rust extension is not available
 # ============================================================================